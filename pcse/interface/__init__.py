@@ -11,6 +11,10 @@ from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 import json
 
+import pandas as pd
+
+from pcse.perception import PhoenixDataPortal
+
 app = FastAPI(
     title="Phoenix Civic Simulation Engine",
     description="Human-AI collaborative urban heat intervention planning",
@@ -82,15 +86,34 @@ async def simulate_intervention(request: InterventionRequest) -> SimulationResul
     )
 
 
+# Heat vulnerability frame from the perception layer, loaded lazily once
+_hvi_df: Optional[pd.DataFrame] = None
+
+
+def _get_hvi() -> pd.DataFrame:
+    global _hvi_df
+    if _hvi_df is None:
+        _hvi_df = PhoenixDataPortal()._generate_synthetic_hvi()
+    return _hvi_df
+
+
 @app.get("/data/vulnerable-populations")
 async def get_vulnerable_populations(threshold: float = 50.0):
     """Get census tracts with high heat vulnerability."""
-    # TODO: Connect to perception layer
+    df = _get_hvi()
+    df = df[df['heat_vulnerability_score'] >= threshold]
+
+    # Slice before conversion, round columnar, then one C-level records pass
+    # instead of per-row dict building
+    out = df.head(500)[['census_tract_id', 'heat_vulnerability_score', 'lat', 'lon']]
+    out = out.rename(columns={'census_tract_id': 'id', 'heat_vulnerability_score': 'vulnerability'})
+    out = out.astype({'id': str})
+    out = out.round({'vulnerability': 1, 'lat': 6, 'lon': 6})
+
     return {
-        "tracts": [
-            {"id": "04013010100", "vulnerability": 78.5, "lat": 33.45, "lon": -112.07},
-            {"id": "04013010200", "vulnerability": 65.2, "lat": 33.44, "lon": -112.08},
-        ]
+        "count": len(df),
+        "threshold": threshold,
+        "tracts": out.to_dict(orient="records")
     }
 
 
@@ -19,6 +19,24 @@ from shapely.geometry import Point, Polygon
 
 logger = logging.getLogger(__name__)
 
+# data_fetcher is the single source of truth for raw HTTP fetching;
+# re-exported here so callers never import a stale copy
+from pcse.perception.data_fetcher import (  # noqa: E402
+    ASUDataFetcher,
+    NOAAWeatherFetcher,
+    PhoenixDataFetcher,
+)
+
+# One pooled client for the whole perception layer: keep-alive
+# connections and HTTP/2 multiplexing mean concurrent fetches to the
+# same origin share sockets instead of paying TCP+TLS handshakes per
+# portal instance.
+_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+)
+
 
 @dataclass
 class DataSource:
@@ -45,9 +63,9 @@ class PhoenixDataPortal:
     
     BASE_URL = "https://www.phoenixopendata.com"
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
         self.api_key = api_key
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = client or _CLIENT
         self.cache_dir = Path("pcse/data/cache")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
     
@@ -70,7 +88,9 @@ class PhoenixDataPortal:
         
         # TODO: Implement actual data fetching
         # For MVP, we'll create synthetic but realistic data structure
-        return self._generate_synthetic_hvi()
+        return await asyncio.to_thread(
+            self._cached_synthetic, 'heat_vulnerability', self._generate_synthetic_hvi
+        )
     
     async def fetch_transit_heat_relief(self) -> pd.DataFrame:
         """
@@ -79,22 +99,43 @@ class PhoenixDataPortal:
         The city runs cooling buses during heat emergencies.
         """
         logger.info("Fetching transit heat relief data...")
-        return self._generate_synthetic_transit_data()
+        return await asyncio.to_thread(
+            self._cached_synthetic, 'transit_heat_relief', self._generate_synthetic_transit_data
+        )
     
     async def fetch_tree_canopy(self) -> pd.DataFrame:
         """
         Fetch tree canopy coverage data by neighborhood.
         """
         logger.info("Fetching tree canopy data...")
-        return self._generate_synthetic_canopy_data()
+        return await asyncio.to_thread(
+            self._cached_synthetic, 'tree_canopy', self._generate_synthetic_canopy_data
+        )
     
     async def fetch_er_heat_visits(self) -> pd.DataFrame:
         """
         Fetch emergency room visits for heat-related illness.
         """
         logger.info("Fetching ER heat visit data...")
-        return self._generate_synthetic_er_data()
+        return await asyncio.to_thread(
+            self._cached_synthetic, 'er_heat_visits', self._generate_synthetic_er_data
+        )
     
+    def _cached_synthetic(self, name: str, builder) -> pd.DataFrame:
+        """Generate a synthetic dataset once, then serve it from parquet.
+
+        The seeded RNG always produces the same frame, so there is no
+        reason for every process (or every Uvicorn worker) to rebuild
+        it. Memory-mapped Arrow pages are shared via the OS page cache.
+        """
+        path = self.cache_dir / f"{name}.parquet"
+        if path.exists():
+            return pd.read_parquet(path, engine="pyarrow", memory_map=True)
+
+        df = builder()
+        df.to_parquet(path)
+        return df
+
     def _generate_synthetic_hvi(self) -> pd.DataFrame:
         """
         Generate realistic synthetic heat vulnerability data.
@@ -168,46 +209,54 @@ class PhoenixDataPortal:
         import numpy as np
         
         np.random.seed(45)
-        
-        # Generate daily data for 2024
+
+        # Generate daily data for 2024 as one contiguous NumPy pipeline:
+        # draw both ER-visit regimes up front, then select by temperature
         dates = pd.date_range('2024-01-01', '2024-12-31', freq='D')
         n_days = len(dates)
-        
-        data = {
+
+        temps = (
+            70 + 30 * np.sin(2 * np.pi * np.arange(n_days) / 365 - np.pi / 2)
+            + np.random.normal(0, 5, n_days)
+        )
+        base_visits = np.random.poisson(5, n_days)
+        hot_lam = np.clip((temps - 105) * 2, 0, None)
+        hot_visits = np.random.poisson(hot_lam)
+        visits = np.where(temps > 100, hot_visits, base_visits)
+
+        return pd.DataFrame({
             'date': dates,
-            'max_temp_f': 70 + 30 * np.sin(2 * np.pi * np.arange(n_days) / 365 - np.pi/2) + np.random.normal(0, 5, n_days),
-            'heat_er_visits': np.random.poisson(5, n_days),
+            'max_temp_f': temps,
+            'heat_er_visits': visits,
             'heat_deaths': np.random.poisson(0.1, n_days),
-        }
-        
-        df = pd.DataFrame(data)
-        
-        # Correlate ER visits with temperature
-        df['heat_er_visits'] = df.apply(
-            lambda row: np.random.poisson(max(0, (row['max_temp_f'] - 105) * 2)) if row['max_temp_f'] > 100 
-            else row['heat_er_visits'], 
-            axis=1
-        )
-        
-        return df
+        })
     
     async def ingest_all(self) -> Dict[str, pd.DataFrame]:
-        """Ingest all available data sources."""
+        """Ingest all available data sources concurrently."""
         logger.info("Starting full data ingestion...")
-        
+
+        # The four sources are independent, so fetch them in parallel:
+        # wall time becomes max(fetch) rather than sum(fetch)
+        hvi, transit, canopy, er = await asyncio.gather(
+            self.fetch_heat_vulnerability_index(),
+            self.fetch_transit_heat_relief(),
+            self.fetch_tree_canopy(),
+            self.fetch_er_heat_visits(),
+        )
         results = {
-            'heat_vulnerability': await self.fetch_heat_vulnerability_index(),
-            'transit_heat_relief': await self.fetch_transit_heat_relief(),
-            'tree_canopy': await self.fetch_tree_canopy(),
-            'er_heat_visits': await self.fetch_er_heat_visits(),
+            'heat_vulnerability': hvi,
+            'transit_heat_relief': transit,
+            'tree_canopy': canopy,
+            'er_heat_visits': er,
         }
-        
+
         logger.info(f"Ingested {len(results)} data sources")
         return results
     
     async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Close HTTP client (only if this portal owns a private one)."""
+        if self.client is not _CLIENT:
+            await self.client.aclose()
 
 
 class DataIngestionPipeline:
@@ -7,29 +7,169 @@ Agent-based modeling of urban heat dynamics and intervention impacts.
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Any
+from functools import cached_property, lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any
 import random
 
 import numpy as np
 import pandas as pd
 from scipy.spatial import cKDTree
 
+try:
+    from numba import njit, prange, vectorize
+    _NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - numba is optional
+    _NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
+if _NUMBA_AVAILABLE:
+    @njit
+    def _mix64(x):
+        """Finalizer-style 64-bit avalanche hash (MurmurHash3 fmix64)."""
+        x = (x ^ (x >> np.uint64(33))) * np.uint64(0xFF51AFD7ED558CCD)
+        x = (x ^ (x >> np.uint64(33))) * np.uint64(0xC4CEB9FE1A85EC53)
+        return x ^ (x >> np.uint64(33))
+
+    @njit(parallel=True, fastmath=True)
+    def _step_day_kernel(max_temp, has_car, vuln, cool, transit, canopy,
+                         exposure, hydration, health, seed, day):
+        """Fused per-day update over the population columns.
+
+        One prange pass per agent on scalar locals: exposure,
+        intervention effects, health transitions, recovery, outcome
+        counting AND the stochastic draws all happen register-resident,
+        with none of the full-length temporaries the np.where
+        formulation allocates. Uniforms come from a counter-based hash
+        of (seed, day, agent, stream) — stateless, so every thread
+        draws independently yet the run stays fully deterministic.
+        Status codes match ResidentArray (2=illness, 3=severe, 4=dead).
+        """
+        tag = seed ^ (day << np.uint64(40))
+        inv53 = 1.0 / 9007199254740992.0  # map 53 hash bits onto [0, 1)
+        n_ill = 0
+        n_sev = 0
+        er_visits = 0
+        deaths = 0
+        for i in prange(exposure.shape[0]):
+            e = max_temp - 85.0
+            if e < 0.0:
+                e = 0.0
+            if cool[i] and max_temp > 105.0:
+                e *= 0.5
+            if transit[i] and not has_car[i]:
+                e *= 0.8
+            if canopy[i]:
+                e *= 0.85
+            exposure[i] = e
+
+            # Two low bits select the stream (illness/severe/ER/death);
+            # xor, not or, so the selection works whatever the seed bits
+            ctr = tag ^ (np.uint64(i) << np.uint64(2))
+            h = health[i]
+            if h != 4:
+                if e > 20.0:
+                    hydration[i] -= 0.1
+                    u_ill = (_mix64(ctr) >> np.uint64(11)) * inv53
+                    if u_ill < 0.01 * vuln[i] / 100.0:
+                        h = 2
+                if e > 30.0 and vuln[i] > 60.0:
+                    u_sev = (_mix64(ctr ^ np.uint64(1)) >> np.uint64(11)) * inv53
+                    if u_sev < 0.05:
+                        h = 3
+
+            hyd = hydration[i] + 0.5
+            hydration[i] = 1.0 if hyd > 1.0 else hyd
+
+            if h == 2:
+                n_ill += 1
+                u_er = (_mix64(ctr ^ np.uint64(2)) >> np.uint64(11)) * inv53
+                if u_er < 0.1:
+                    er_visits += 1
+            elif h == 3:
+                n_sev += 1
+                er_visits += 1
+                u_death = (_mix64(ctr ^ np.uint64(3)) >> np.uint64(11)) * inv53
+                if u_death < 0.05:
+                    deaths += 1
+                    h = 4
+            health[i] = h
+        return n_ill, n_sev, er_visits, deaths
+
+    @njit(parallel=True, fastmath=True)
+    def _step_day_kernel_plain(max_temp, vuln, exposure, hydration, health,
+                               seed, day):
+        """No-intervention variant of _step_day_kernel.
+
+        Baseline runs are half of every A/B comparison; this drops the
+        three mask reads and their branches so exposure is one shared
+        scalar and the per-agent body is pure transition/tally work.
+        Must stay draw-for-draw identical to the masked kernel so the
+        two baseline paths agree exactly.
+        """
+        e = max_temp - 85.0
+        if e < 0.0:
+            e = 0.0
+        tag = seed ^ (day << np.uint64(40))
+        inv53 = 1.0 / 9007199254740992.0
+        n_ill = 0
+        n_sev = 0
+        er_visits = 0
+        deaths = 0
+        for i in prange(exposure.shape[0]):
+            exposure[i] = e
+
+            ctr = tag ^ (np.uint64(i) << np.uint64(2))
+            h = health[i]
+            if h != 4:
+                if e > 20.0:
+                    hydration[i] -= 0.1
+                    u_ill = (_mix64(ctr) >> np.uint64(11)) * inv53
+                    if u_ill < 0.01 * vuln[i] / 100.0:
+                        h = 2
+                if e > 30.0 and vuln[i] > 60.0:
+                    u_sev = (_mix64(ctr ^ np.uint64(1)) >> np.uint64(11)) * inv53
+                    if u_sev < 0.05:
+                        h = 3
+
+            hyd = hydration[i] + 0.5
+            hydration[i] = 1.0 if hyd > 1.0 else hyd
+
+            if h == 2:
+                n_ill += 1
+                u_er = (_mix64(ctr ^ np.uint64(2)) >> np.uint64(11)) * inv53
+                if u_er < 0.1:
+                    er_visits += 1
+            elif h == 3:
+                n_sev += 1
+                er_visits += 1
+                u_death = (_mix64(ctr ^ np.uint64(3)) >> np.uint64(11)) * inv53
+                if u_death < 0.05:
+                    deaths += 1
+                    h = 4
+            health[i] = h
+        return n_ill, n_sev, er_visits, deaths
+
+
 class DemographicProfile(Enum):
     """Vulnerability profiles based on age, income, housing."""
     LOW_RISK = "low_risk"
-    MODERATE_RISK = "moderate_risk" 
+    MODERATE_RISK = "moderate_risk"
     HIGH_RISK = "high_risk"
     EXTREME_RISK = "extreme_risk"
 
 
-@dataclass
+@dataclass(slots=True)
 class SyntheticResident:
     """
     An agent representing a synthetic resident of Phoenix.
-    
+
+    The simulation itself runs on ResidentArray columns; this dataclass
+    remains as the per-agent view for callers that want one object.
+    Slots drop the per-instance __dict__, which matters when a caller
+    materializes the whole population as views.
+
     Attributes:
         id: Unique identifier
         lat, lon: Geographic location
@@ -52,51 +192,38 @@ class SyntheticResident:
     works_outdoors: bool
     health_conditions: List[str] = field(default_factory=list)
     social_isolation: float = 0.0
-    
+
     # Dynamic state
     current_location: Tuple[float, float] = field(init=False)
+    heat_vulnerability: float = field(init=False, default=0.0)
     heat_exposure_today: float = 0.0
     hydration_level: float = 1.0
     health_status: str = "healthy"  # healthy, stressed, heat_illness, severe
-    
+
     def __post_init__(self):
         self.current_location = (self.lat, self.lon)
         self.heat_vulnerability = self._compute_vulnerability()
-    
+
     def _compute_vulnerability(self) -> float:
-        """Compute heat vulnerability score (0-100)."""
-        score = 0.0
-        
-        # Age factor
-        if self.age > 65:
-            score += 25
-        elif self.age < 5:
-            score += 20
-        elif self.age > 50:
-            score += 10
-        
-        # Income factor (poverty = higher risk)
-        if self.income < 20000:
-            score += 20
-        elif self.income < 40000:
-            score += 10
-        
-        # AC access (critical factor)
-        if not self.has_ac:
-            score += 30
-        
-        # Outdoor work
-        if self.works_outdoors:
-            score += 15
-        
-        # Health conditions
-        score += len(self.health_conditions) * 5
-        
-        # Social isolation
-        score += self.social_isolation * 10
-        
-        return min(100, score)
-    
+        """Compute heat vulnerability score (0-100).
+
+        Computed once in __post_init__ and cached on the instance; the
+        compiled ufunc handles the scalar call when numba is present.
+        """
+        if _NUMBA_AVAILABLE:
+            # Cast to the signature dtypes; plain Python scalars do not
+            # coerce under the ufunc's 'safe' casting rule
+            return float(_vuln_ufunc(
+                np.uint8(self.age), np.float32(self.income),
+                np.bool_(self.has_ac), np.bool_(self.works_outdoors),
+                np.uint8(len(self.health_conditions)),
+                np.float32(self.social_isolation),
+            ))
+        return _vulnerability_scalar(
+            self.age, self.income, self.has_ac, self.works_outdoors,
+            len(self.health_conditions), self.social_isolation
+        )
+
     def profile(self) -> DemographicProfile:
         """Classify into risk profile."""
         if self.heat_vulnerability < 25:
@@ -107,44 +234,202 @@ class SyntheticResident:
             return DemographicProfile.HIGH_RISK
         else:
             return DemographicProfile.EXTREME_RISK
-    
+
     def update_daily(self, max_temp: float, interventions: Dict[str, Any]):
         """Update agent state for a day given temperature and interventions."""
-        
+
         # Heat exposure
         base_exposure = max(0, max_temp - 85)  # Stress starts at 85°F
-        
+
         # Intervention effects
         if interventions.get('cooling_center_nearby') and max_temp > 105:
             base_exposure *= 0.5
-        
+
         if interventions.get('transit_cooling') and not self.has_car:
             base_exposure *= 0.8
-        
+
         if interventions.get('neighborhood_canopy_increase'):
             base_exposure *= 0.85
-        
+
         self.heat_exposure_today = base_exposure
-        
+
         # Health impact
         if base_exposure > 20:
             self.hydration_level -= 0.1
             if random.random() < 0.01 * self.heat_vulnerability / 100:
                 self.health_status = "heat_illness"
-        
+
         if base_exposure > 30 and self.heat_vulnerability > 60:
             if random.random() < 0.05:
                 self.health_status = "severe"
-        
+
         # Recovery overnight
         self.hydration_level = min(1.0, self.hydration_level + 0.5)
 
 
-@dataclass
+def _vulnerability_scalar(age: int, income: float, has_ac: bool,
+                          works_outdoors: bool, n_conditions: int,
+                          social_isolation: float) -> float:
+    """Heat vulnerability score (0-100) for one agent."""
+    score = 0.0
+
+    # Age factor
+    if age > 65:
+        score += 25
+    elif age < 5:
+        score += 20
+    elif age > 50:
+        score += 10
+
+    # Income factor (poverty = higher risk)
+    if income < 20000:
+        score += 20
+    elif income < 40000:
+        score += 10
+
+    # AC access (critical factor)
+    if not has_ac:
+        score += 30
+
+    # Outdoor work
+    if works_outdoors:
+        score += 15
+
+    # Health conditions
+    score += n_conditions * 5
+
+    # Social isolation
+    score += social_isolation * 10
+
+    return min(100, score)
+
+
+if _NUMBA_AVAILABLE:
+    # Compile the scalar formula as a ufunc: one code path serves both
+    # the per-agent dataclass view (scalar call, ufunc dispatch only)
+    # and the bulk SoA scoring pass, where the parallel target fans the
+    # SIMD loop out across threads. The signature matches the column
+    # dtypes exactly so the bulk call never copies.
+    _vuln_ufunc = vectorize(
+        ['float32(uint8, float32, boolean, boolean, uint8, float32)'],
+        target='parallel',
+    )(_vulnerability_scalar)
+
+
+def compute_vulnerability_vec(ages: np.ndarray, incomes: np.ndarray,
+                              has_ac: np.ndarray, works_outdoors: np.ndarray,
+                              n_conditions: np.ndarray,
+                              social_isolation: np.ndarray) -> np.ndarray:
+    """Heat vulnerability scores (0-100) for the whole population.
+
+    Dispatches to the compiled ufunc when numba is present — a single
+    fused pass over the columns. The fallback is the branchless NumPy
+    counterpart of _vulnerability_scalar: every factor is an
+    np.select/np.where over the column arrays, so scoring 100k agents is
+    a few C-level passes instead of 100k Python frames.
+    """
+    if _NUMBA_AVAILABLE:
+        return _vuln_ufunc(ages, incomes, has_ac, works_outdoors,
+                           n_conditions, social_isolation)
+
+    score = np.select([ages > 65, ages < 5, ages > 50], [25.0, 20.0, 10.0], 0.0)
+    score += np.select([incomes < 20000, incomes < 40000], [20.0, 10.0], 0.0)
+    score += np.where(~has_ac, 30.0, 0.0)
+    score += np.where(works_outdoors, 15.0, 0.0)
+    score += n_conditions * 5.0
+    score += social_isolation * 10.0
+    return np.minimum(score, 100.0).astype(np.float32)
+
+
+# Bits set per byte value; one fancy-indexing pass counts conditions
+# for the whole population from the bitmask column
+_POPCOUNT = np.unpackbits(
+    np.arange(256, dtype=np.uint8)[:, None], axis=1
+).sum(axis=1).astype(np.uint8)
+
+
+class ResidentArray:
+    """
+    Structure-of-arrays store for the synthetic population.
+
+    One typed, contiguous NumPy array per attribute, so the daily update
+    and every filter run as vectorized scans over packed buffers instead
+    of pointer-chasing 100k Python objects with per-attribute lookups.
+    Health status is an int8 code so comparisons and counts vectorize;
+    float32 is plenty of precision for coordinates, dollars, and 0-100
+    scores, and halves the bytes moved per scan.
+    """
+
+    # Health status codes (int8)
+    HEALTHY = 0
+    STRESSED = 1
+    HEAT_ILLNESS = 2
+    SEVERE = 3
+    DEAD = 4
+
+    # Health-condition bits in the uint8 conditions column; labels are
+    # only materialized for per-agent views
+    CONDITION_CARDIO = 0x01
+    CONDITION_DIABETES = 0x02
+    CONDITION_LABELS = (
+        ('cardiovascular', CONDITION_CARDIO),
+        ('diabetes', CONDITION_DIABETES),
+    )
+
+    # Profile codes ordered by severity; index matches DemographicProfile
+    PROFILE_NAMES = tuple(p.value for p in DemographicProfile)
+    # Reused wherever codes become labels: pd.Categorical.from_codes
+    # wants a list, np fancy-indexing wants an array
+    PROFILE_CATEGORIES = list(PROFILE_NAMES)
+    PROFILE_LOOKUP = np.array(PROFILE_NAMES)
+
+    def __init__(self, n: int):
+        self.n = n
+        self.id = np.arange(n, dtype=np.int32)
+        self.lat = np.zeros(n, dtype=np.float32)
+        self.lon = np.zeros(n, dtype=np.float32)
+        self.age = np.zeros(n, dtype=np.uint8)
+        self.income = np.zeros(n, dtype=np.float32)
+        self.has_ac = np.zeros(n, dtype=np.bool_)
+        self.has_car = np.zeros(n, dtype=np.bool_)
+        self.works_outdoors = np.zeros(n, dtype=np.bool_)
+        self.conditions = np.zeros(n, dtype=np.uint8)
+        self.n_conditions = np.zeros(n, dtype=np.uint8)
+        self.social_isolation = np.zeros(n, dtype=np.float32)
+        self.heat_vulnerability = np.zeros(n, dtype=np.float32)
+        self.profile_code = np.zeros(n, dtype=np.uint8)
+
+        # Dynamic state
+        self.heat_exposure_today = np.zeros(n, dtype=np.float32)
+        self.hydration_level = np.ones(n, dtype=np.float32)
+        self.health_status = np.zeros(n, dtype=np.int8)
+
+    def resident(self, i: int) -> SyntheticResident:
+        """Materialize one agent as a dataclass view (compatibility)."""
+        bits = self.conditions[i]
+        conditions = [label for label, bit in self.CONDITION_LABELS if bits & bit]
+        return SyntheticResident(
+            id=int(self.id[i]),
+            lat=float(self.lat[i]),
+            lon=float(self.lon[i]),
+            age=int(self.age[i]),
+            income=float(self.income[i]),
+            has_ac=bool(self.has_ac[i]),
+            has_car=bool(self.has_car[i]),
+            works_outdoors=bool(self.works_outdoors[i]),
+            health_conditions=conditions,
+            social_isolation=float(self.social_isolation[i]),
+        )
+
+
+@dataclass(frozen=True)
 class InterventionScenario:
     """
     A proposed urban intervention.
-    
+
+    Frozen: scenarios never change after construction, which makes
+    validation a pure function of the fields and safe to cache.
+
     Examples:
     - Plant 1,000 trees in census tract X
     - Deploy 5 cooling buses on route Y
@@ -157,17 +442,131 @@ class InterventionScenario:
     implementation_cost: float  # Dollars
     timeline_months: int
     expected_outcomes: Dict[str, float] = field(default_factory=dict)
-    
+
+    VALID_TYPES = frozenset({
+        'tree_canopy', 'cooling_center', 'transit_cooling', 'cool_roofs'
+    })
+
+    # Shared by the scalar and vectorized validators so the three
+    # paths can never drift apart
+    LAT_BOUNDS = (-90.0, 90.0)
+    LON_BOUNDS = (-180.0, 180.0)
+    RADIUS_BOUNDS = (0.0001, 50.0)
+
+    @cached_property
     def validate(self) -> bool:
-        """Check if intervention is feasible given constraints."""
-        # TODO: Implement validation logic
+        """Whether the intervention is feasible given constraints.
+
+        Computed once per instance: type membership is a frozenset
+        lookup, then cost/timeline positivity, then bounds checks when
+        the target area carries a center point. Tract- or polygon-based
+        target areas pass through (their geometry is resolved at
+        mapping time, not here).
+        """
+        if self.intervention_type not in self.VALID_TYPES:
+            return False
+        if self.implementation_cost <= 0 or self.timeline_months <= 0:
+            return False
+        area = self.target_area
+        if 'center_lat' in area:
+            return (
+                self.LAT_BOUNDS[0] <= area['center_lat'] <= self.LAT_BOUNDS[1]
+                and self.LON_BOUNDS[0] <= area['center_lon'] <= self.LON_BOUNDS[1]
+                and self.RADIUS_BOUNDS[0] <= area.get('radius_km', 1.0) <= self.RADIUS_BOUNDS[1]
+            )
         return True
 
+    @classmethod
+    def validate_batch(cls, df: pd.DataFrame) -> np.ndarray:
+        """Validate many interventions at once, one row each.
+
+        Expects columns intervention_type, implementation_cost,
+        timeline_months, center_lat, center_lon, and radius_km; returns
+        a boolean feasibility mask. Every check is a vectorized column
+        comparison, so parameter sweeps validate m scenarios with O(1)
+        Python calls instead of one validate() round trip each.
+        """
+        return (
+            df['intervention_type'].isin(cls.VALID_TYPES).to_numpy()
+            & (df['implementation_cost'].to_numpy() > 0)
+            & (df['timeline_months'].to_numpy() > 0)
+            & df['center_lat'].between(*cls.LAT_BOUNDS).to_numpy()
+            & df['center_lon'].between(*cls.LON_BOUNDS).to_numpy()
+            & df['radius_km'].between(*cls.RADIUS_BOUNDS).to_numpy()
+        )
+
+    @classmethod
+    def validate_many(cls, interventions: List['InterventionScenario']) -> np.ndarray:
+        """Feasibility mask for a list of scenario objects.
+
+        Bridges the scalar and DataFrame validators: stacks the fields
+        into arrays once and applies the same bounds as validate, with
+        center-less target areas passing through just as the scalar
+        path does. Lets a parameter sweep over built scenarios validate
+        in one AND chain instead of m cached-property evaluations.
+        """
+        types_ok = np.array(
+            [iv.intervention_type in cls.VALID_TYPES for iv in interventions]
+        )
+        costs = np.array([iv.implementation_cost for iv in interventions])
+        months = np.array([iv.timeline_months for iv in interventions])
+        located = np.array(
+            [('center_lat' in iv.target_area) for iv in interventions]
+        )
+        lats = np.array(
+            [iv.target_area.get('center_lat', 0.0) for iv in interventions]
+        )
+        lons = np.array(
+            [iv.target_area.get('center_lon', 0.0) for iv in interventions]
+        )
+        radii = np.array(
+            [iv.target_area.get('radius_km', 1.0) for iv in interventions]
+        )
+        bounds_ok = (
+            (lats >= cls.LAT_BOUNDS[0]) & (lats <= cls.LAT_BOUNDS[1])
+            & (lons >= cls.LON_BOUNDS[0]) & (lons <= cls.LON_BOUNDS[1])
+            & (radii >= cls.RADIUS_BOUNDS[0]) & (radii <= cls.RADIUS_BOUNDS[1])
+        )
+        return types_ok & (costs > 0) & (months > 0) & (~located | bounds_ok)
+
+
+class InterventionState(NamedTuple):
+    """Per-resident boolean masks for the active intervention types.
+
+    The typed, fixed-shape bundle the day kernel consumes — resolved
+    once per scenario from the InterventionScenario list, so the hot
+    path never touches Python dicts or scenario objects. Being a
+    NamedTuple it still unpacks positionally like the bare mask tuple
+    it replaced.
+    """
+    cooling_center: np.ndarray
+    transit_cooling: np.ndarray
+    tree_canopy: np.ndarray
+
+
+@lru_cache(maxsize=8)
+def _phoenix_temperature_profile(days: int, seed: int = 42) -> np.ndarray:
+    """Seasonal Phoenix temperature profile, cached per (days, seed).
+
+    One np.sin sweep plus one batched normal draw; the result is
+    deterministic given the seed, so repeated scenarios of the same
+    length share a single array. Marked read-only so no caller can
+    mutate the cached copy out from under the others.
+    """
+    rng = np.random.default_rng(seed)
+    day_of_year = np.arange(days) % 365
+    temps = (
+        70 + 35 * np.sin(2 * np.pi * day_of_year / 365 - np.pi / 2)
+        + rng.normal(0, 5, days)
+    ).astype(np.float32)
+    temps.flags.writeable = False
+    return temps
+
 
 class UrbanHeatSimulator:
     """
     Main simulation engine for urban heat dynamics.
-    
+
     Simulates:
     - 100,000 synthetic residents
     - Daily temperature variations
@@ -175,251 +574,568 @@ class UrbanHeatSimulator:
     - Health outcomes
     - Economic costs/benefits
     """
-    
+
     def __init__(self, n_residents: int = 100000):
         self.n_residents = n_residents
-        self.residents: List[SyntheticResident] = []
+        self.store: Optional[ResidentArray] = None
+        self.residents_df: Optional[pd.DataFrame] = None
         self.spatial_index: Optional[cKDTree] = None
         self.current_day = 0
-        self.history: List[Dict] = []
-        
+        # Daily history as preallocated parallel arrays (one slot per
+        # day) rather than a list of dicts: run_day writes by index and
+        # scenario totals are single C-level sums
+        self._hist_capacity = 0
+        self.hist_temp = np.empty(0, dtype=np.float32)
+        self.hist_heat_illness = np.empty(0, dtype=np.int32)
+        self.hist_severe = np.empty(0, dtype=np.int32)
+        self.hist_deaths = np.empty(0, dtype=np.int32)
+        self.hist_er_visits = np.empty(0, dtype=np.int32)
+        self.hist_active_interventions = np.empty(0, dtype=np.int16)
+        # PCG64 generator for the daily stochastic draws; batched
+        # rng.random(n) is ~10x faster than per-call random.random()
+        self._rng = np.random.default_rng(42)
+        self._residents_view: Optional[List[SyntheticResident]] = None
+        self._vuln_order: Optional[np.ndarray] = None
+        self._vuln_sorted: Optional[np.ndarray] = None
+        # True while any resident is in an illness state; lets mild
+        # days skip the population sweep entirely
+        self._any_affected = False
+
         # Phoenix bounds (rough)
         self.lat_min, self.lat_max = 33.3, 33.6
         self.lon_min, self.lon_max = -112.3, -111.8
-    
+
+        # Local equirectangular projection about the metro center. The
+        # spatial index lives in this meter space: distances are true
+        # meters (a degree of longitude shrinks with latitude, so the
+        # old radius/111 degree hack overshot east-west) and equal-scale
+        # axes let the KD-tree prune tighter.
+        self.lat_mid = (self.lat_min + self.lat_max) / 2
+        self.lon_mid = (self.lon_min + self.lon_max) / 2
+        self.m_per_deg_lat = 110_540.0
+        self.m_per_deg_lon = 111_320.0 * float(np.cos(np.radians(self.lat_mid)))
+
+    def project(self, lat, lon) -> Tuple[np.ndarray, np.ndarray]:
+        """Project degrees into the local meter grid as (x, y)."""
+        x = (np.asarray(lon, dtype=np.float64) - self.lon_mid) * self.m_per_deg_lon
+        y = (np.asarray(lat, dtype=np.float64) - self.lat_mid) * self.m_per_deg_lat
+        return x, y
+
+    _HIST_COLUMNS = ('hist_temp', 'hist_heat_illness', 'hist_severe',
+                     'hist_deaths', 'hist_er_visits', 'hist_active_interventions')
+
+    def _ensure_history_capacity(self, extra_days: int):
+        """Grow the history arrays so extra_days more slots fit."""
+        need = self.current_day + extra_days
+        if need <= self._hist_capacity:
+            return
+        new_cap = max(need, 64, self._hist_capacity * 2)
+        for name in self._HIST_COLUMNS:
+            old = getattr(self, name)
+            grown = np.zeros(new_cap, dtype=old.dtype)
+            grown[:old.size] = old
+            setattr(self, name, grown)
+        self._hist_capacity = new_cap
+
+    @property
+    def history(self) -> List[Dict]:
+        """Per-day records materialized from the history arrays.
+
+        Compatibility view; totals should sum the arrays directly.
+        """
+        return self._history_records()
+
+    def _history_records(self) -> List[Dict]:
+        return [
+            {
+                'day': day,
+                'max_temp': float(self.hist_temp[day]),
+                'outcomes': {
+                    'heat_illness': int(self.hist_heat_illness[day]),
+                    'severe_heat_illness': int(self.hist_severe[day]),
+                    'deaths': int(self.hist_deaths[day]),
+                    'er_visits': int(self.hist_er_visits[day]),
+                },
+                'active_interventions': int(self.hist_active_interventions[day]),
+            }
+            for day in range(self.current_day)
+        ]
+
+    @property
+    def residents(self) -> List[SyntheticResident]:
+        """Per-agent dataclass views, materialized lazily.
+
+        Compatibility shim for callers that iterate agents; the
+        simulation itself runs on the `store` columns.
+        """
+        if self._residents_view is None:
+            if self.store is None:
+                return []
+            self._residents_view = [
+                self.store.resident(i) for i in range(self.store.n)
+            ]
+        return self._residents_view
+
     def generate_synthetic_population(self, demographic_data: Optional[pd.DataFrame] = None):
         """
         Generate synthetic residents based on Phoenix demographics.
         """
         logger.info(f"Generating {self.n_residents} synthetic residents...")
-        
-        random.seed(42)
-        np.random.seed(42)
-        
-        for i in range(self.n_residents):
-            # Geographic distribution (clustered like real Phoenix)
-            lat = np.random.normal(33.45, 0.08)
-            lon = np.random.normal(-112.07, 0.12)
-            
-            # Ensure within bounds
-            lat = np.clip(lat, self.lat_min, self.lat_max)
-            lon = np.clip(lon, self.lon_min, self.lon_max)
-            
-            # Demographics (simplified model)
-            age = int(np.random.choice(
-                [np.random.randint(0, 18), np.random.randint(18, 65), np.random.randint(65, 95)],
-                p=[0.25, 0.60, 0.15]
-            ))
-            
-            income = np.random.lognormal(11, 0.6)  # Median ~$50k
-            
-            # Access to resources (correlated with income)
-            has_ac = random.random() < (0.5 + 0.4 * (income / 100000))
-            has_car = random.random() < (0.6 + 0.3 * (income / 100000))
-            
-            # Employment
-            works_outdoors = random.random() < 0.15 and age > 18 and age < 65
-            
-            # Health (correlated with age)
-            health_conditions = []
-            if age > 50 and random.random() < 0.3:
-                health_conditions.append('cardiovascular')
-            if age > 40 and random.random() < 0.2:
-                health_conditions.append('diabetes')
-            
-            resident = SyntheticResident(
-                id=i,
-                lat=lat,
-                lon=lon,
-                age=age,
-                income=income,
-                has_ac=has_ac,
-                has_car=has_car,
-                works_outdoors=works_outdoors,
-                health_conditions=health_conditions,
-                social_isolation=random.random() * 0.5
-            )
-            
-            self.residents.append(resident)
-        
-        # Build spatial index for fast geographic queries
-        coords = np.array([[r.lat, r.lon] for r in self.residents])
-        self.spatial_index = cKDTree(coords)
-        
-        logger.info(f"Generated {len(self.residents)} residents")
-        
-        # Log demographic breakdown
-        profiles = [r.profile() for r in self.residents]
-        for profile in DemographicProfile:
-            count = profiles.count(profile)
-            logger.info(f"  {profile.value}: {count} ({100*count/len(self.residents):.1f}%)")
-    
-    def run_day(self, max_temp: float, interventions: List[InterventionScenario] = None):
+
+        # One seeded generator, one C-level fill per distribution: each
+        # column comes from a single batched draw at size n instead of
+        # n round trips through per-agent RNG calls
+        rng = np.random.default_rng(42)
+        self._rng = np.random.default_rng(42)  # reset the daily-draw stream too
+
+        n = self.n_residents
+        store = ResidentArray(n)
+
+        # Geographic distribution (clustered like real Phoenix),
+        # clipped to the metro bounds
+        store.lat = np.clip(
+            rng.normal(33.45, 0.08, n), self.lat_min, self.lat_max
+        ).astype(np.float32)
+        store.lon = np.clip(
+            rng.normal(-112.07, 0.12, n), self.lon_min, self.lon_max
+        ).astype(np.float32)
+
+        # Demographics (simplified model): pick an age bucket per agent,
+        # then draw uniformly within it
+        bucket = rng.choice(3, n, p=[0.25, 0.60, 0.15])
+        ages = np.where(
+            bucket == 0, rng.integers(0, 18, n),
+            np.where(bucket == 1, rng.integers(18, 65, n), rng.integers(65, 95, n))
+        )
+        store.age = ages.astype(np.uint8)
+
+        income = rng.lognormal(11, 0.6, n).astype(np.float32)  # Median ~$50k
+        store.income = income
+
+        # Access to resources (correlated with income)
+        store.has_ac = rng.random(n) < (0.5 + 0.4 * (income / 100000))
+        store.has_car = rng.random(n) < (0.6 + 0.3 * (income / 100000))
+
+        # Employment
+        store.works_outdoors = (rng.random(n) < 0.15) & (ages > 18) & (ages < 65)
+
+        # Health (correlated with age), packed as condition bits
+        cardio = (ages > 50) & (rng.random(n) < 0.3)
+        diabetes = (ages > 40) & (rng.random(n) < 0.2)
+        store.conditions = (
+            cardio.astype(np.uint8) * ResidentArray.CONDITION_CARDIO
+            | diabetes.astype(np.uint8) * ResidentArray.CONDITION_DIABETES
+        )
+        store.n_conditions = _POPCOUNT[store.conditions]
+
+        store.social_isolation = rng.random(n, dtype=np.float32) * np.float32(0.5)
+
+        # Score and classify the whole population in one vectorized pass
+        store.heat_vulnerability = compute_vulnerability_vec(
+            store.age, store.income, store.has_ac, store.works_outdoors,
+            store.n_conditions, store.social_isolation
+        )
+        store.profile_code = np.digitize(
+            store.heat_vulnerability, (25, 50, 75)
+        ).astype(np.uint8)
+
+        # Sorted view over the (static) vulnerability scores: threshold
+        # queries become a binary search plus a suffix slice
+        self._vuln_order = np.argsort(store.heat_vulnerability, kind='stable')
+        self._vuln_sorted = store.heat_vulnerability[self._vuln_order]
+
+        self.store = store
+        self._residents_view = None
+        self._any_affected = False
+
+        # Columnar DataFrame view shared with the API layer; zero-copy
+        # over the same buffers
+        self._build_column_store()
+
+        # Build spatial index for fast geographic queries in the
+        # projected meter space
+        x, y = self.project(store.lat, store.lon)
+        self.spatial_index = cKDTree(np.column_stack([x, y]))
+
+        logger.info(f"Generated {n} residents")
+
+        # Log demographic breakdown: one bincount pass over the codes
+        # instead of a full comparison scan per profile
+        counts = np.bincount(
+            store.profile_code, minlength=len(ResidentArray.PROFILE_NAMES)
+        )
+        for code, profile in enumerate(DemographicProfile):
+            count = int(counts[code])
+            logger.info(f"  {profile.value}: {count} ({100*count/n:.1f}%)")
+
+        if _NUMBA_AVAILABLE:
+            self._warmup_kernel()
+
+    @staticmethod
+    def _warmup_kernel():
+        """Trigger JIT compilation of the day-step kernels on dummy data.
+
+        Compilation costs hundreds of milliseconds; paying it here
+        keeps it out of the first simulated day, where callers would
+        read it as model time. The kernels deliberately do not use
+        numba's on-disk cache: this module is imported both as
+        `simulation` (api.py's sys.path style) and as
+        `pcse.simulation`, and a cache entry written under one module
+        name raises on a hit from the other.
+        """
+        one_f32 = np.zeros(1, dtype=np.float32)
+        one_bool = np.zeros(1, dtype=np.bool_)
+        _step_day_kernel(
+            np.float32(0.0), one_bool, one_f32.copy(),
+            one_bool, one_bool, one_bool,
+            one_f32.copy(), np.ones(1, dtype=np.float32),
+            np.zeros(1, dtype=np.int8),
+            np.uint64(0), np.uint64(0),
+        )
+        _step_day_kernel_plain(
+            np.float32(0.0), one_f32.copy(),
+            one_f32.copy(), np.ones(1, dtype=np.float32),
+            np.zeros(1, dtype=np.int8),
+            np.uint64(0), np.uint64(0),
+        )
+
+    def _build_column_store(self):
+        """Materialize the DataFrame view over the population columns."""
+        store = self.store
+        self.residents_df = pd.DataFrame({
+            'id': store.id,
+            'lat': store.lat,
+            'lon': store.lon,
+            'age': store.age,
+            'income': store.income,
+            'has_ac': store.has_ac,
+            'has_car': store.has_car,
+            'works_outdoors': store.works_outdoors,
+            'heat_vulnerability': store.heat_vulnerability,
+            'profile': pd.Categorical.from_codes(
+                store.profile_code, ResidentArray.PROFILE_CATEGORIES
+            ),
+        }, copy=False)
+
+    def run_day(self, max_temp: float, interventions: List[InterventionScenario] = None,
+                masks: Optional[InterventionState] = None):
         """
         Simulate one day given temperature and active interventions.
+
+        The whole population steps as a handful of vectorized passes
+        over the column store — boolean masks stand in for the old
+        per-resident branches. Interventions are static within a
+        scenario, so run_scenario precomputes the masks once and passes
+        them in; ad-hoc single-day callers can omit them and pay the
+        spatial query here.
         """
         interventions = interventions or []
-        
-        # Map interventions to residents
-        resident_interventions = self._map_interventions(interventions)
-        
-        # Update each resident
+        store = self.store
+        n = store.n
+
+        # Mild-day fast path: below 85°F exposure is zero for every
+        # agent, so with nobody currently ill the sweep provably
+        # produces all zeros — record the day and skip it. (Hydration
+        # is always back at 1.0 after a day's overnight recovery, so
+        # there is no partial state to advance.) Numba path only: its
+        # draws are counter-based, so a skipped day consumes nothing.
+        # The NumPy fallback draws from the sequential generator, and
+        # whether a day skips depends on scenario state — skipping
+        # would desynchronize the paired uniform streams that
+        # reset_dynamic guarantees for A/B comparisons.
+        if _NUMBA_AVAILABLE and max_temp <= 85.0 and not self._any_affected:
+            store.heat_exposure_today[:] = 0.0
+            daily_outcomes = {
+                'heat_illness': 0,
+                'severe_heat_illness': 0,
+                'deaths': 0,
+                'er_visits': 0,
+            }
+            self._record_day(max_temp, daily_outcomes, len(interventions))
+            return daily_outcomes
+
+        # Map interventions to per-resident boolean masks
+        if masks is None:
+            masks = self._map_interventions(interventions)
+        cool_mask, transit_mask, canopy_mask = masks
+
+        if _NUMBA_AVAILABLE:
+            # Fused kernel: one pass, no full-length temporaries. The
+            # stochastic draws happen inside via a counter-based hash
+            # of (seed, day, agent), so no (4, n) uniform block is
+            # allocated and threads never contend on Generator state.
+            # Baseline runs dispatch to the leaner maskless variant.
+            if interventions:
+                n_ill, n_sev, er_visits, n_deaths = _step_day_kernel(
+                    np.float32(max_temp), store.has_car, store.heat_vulnerability,
+                    cool_mask, transit_mask, canopy_mask,
+                    store.heat_exposure_today, store.hydration_level,
+                    store.health_status,
+                    np.uint64(42), np.uint64(self.current_day),
+                )
+            else:
+                n_ill, n_sev, er_visits, n_deaths = _step_day_kernel_plain(
+                    np.float32(max_temp), store.heat_vulnerability,
+                    store.heat_exposure_today, store.hydration_level,
+                    store.health_status,
+                    np.uint64(42), np.uint64(self.current_day),
+                )
+            daily_outcomes = {
+                'heat_illness': int(n_ill),
+                'severe_heat_illness': int(n_sev),
+                'deaths': int(n_deaths),
+                'er_visits': int(er_visits),
+            }
+            self._any_affected = (n_ill + n_sev) > 0
+            self._record_day(max_temp, daily_outcomes, len(interventions))
+            return daily_outcomes
+
+        # All of the day's stochastic draws in one batched fill: row 0
+        # is illness onset, 1 severe onset, 2 ER conversion, 3 mortality.
+        # (4, n) keeps each row contiguous; float32 halves the bytes
+        u = self._rng.random((4, n), dtype=np.float32)
+
+        # Heat exposure (stress starts at 85°F)
+        base_exposure = max(0.0, max_temp - 85.0)
+        exposure = np.full(n, base_exposure, dtype=np.float32)
+        if max_temp > 105:
+            exposure[cool_mask] *= 0.5
+        exposure[transit_mask & ~store.has_car] *= 0.8
+        exposure[canopy_mask] *= 0.85
+        store.heat_exposure_today = exposure
+
+        alive = store.health_status != ResidentArray.DEAD
+
+        # Health impact
+        hot = (exposure > 20) & alive
+        store.hydration_level[hot] -= 0.1
+        illness = hot & (u[0] < 0.01 * store.heat_vulnerability / 100)
+        store.health_status[illness] = ResidentArray.HEAT_ILLNESS
+
+        severe = (
+            (exposure > 30) & (store.heat_vulnerability > 60)
+            & alive & (u[1] < 0.05)
+        )
+        store.health_status[severe] = ResidentArray.SEVERE
+
+        # Recovery overnight
+        np.minimum(store.hydration_level + 0.5, 1.0, out=store.hydration_level)
+
+        # Track outcomes
+        ill = store.health_status == ResidentArray.HEAT_ILLNESS
+        sev = store.health_status == ResidentArray.SEVERE
+        n_ill = int(np.count_nonzero(ill))
+        n_sev = int(np.count_nonzero(sev))
+
+        er_from_ill = int(np.count_nonzero(ill & (u[2] < 0.1)))  # 10% of heat illness -> ER
+
+        died = sev & (u[3] < 0.05)  # 5% mortality for severe
+        n_deaths = int(np.count_nonzero(died))
+        store.health_status[died] = ResidentArray.DEAD
+
         daily_outcomes = {
-            'heat_illness': 0,
-            'severe_heat_illness': 0,
-            'deaths': 0,
-            'er_visits': 0
+            'heat_illness': n_ill,
+            'severe_heat_illness': n_sev,
+            'deaths': n_deaths,
+            'er_visits': er_from_ill + n_sev,
         }
-        
-        for resident in self.residents:
-            interv = resident_interventions.get(resident.id, {})
-            resident.update_daily(max_temp, interv)
-            
-            # Track outcomes
-            if resident.health_status == "heat_illness":
-                daily_outcomes['heat_illness'] += 1
-                if random.random() < 0.1:  # 10% of heat illness -> ER
-                    daily_outcomes['er_visits'] += 1
-            elif resident.health_status == "severe":
-                daily_outcomes['severe_heat_illness'] += 1
-                daily_outcomes['er_visits'] += 1
-                if random.random() < 0.05:  # 5% mortality for severe
-                    daily_outcomes['deaths'] += 1
-                    resident.health_status = "dead"
-        
-        # Record history
-        self.history.append({
-            'day': self.current_day,
-            'max_temp': max_temp,
-            'outcomes': daily_outcomes,
-            'active_interventions': len(interventions)
-        })
-        
-        self.current_day += 1
-        
+
+        self._any_affected = (n_ill + n_sev) > 0
+        self._record_day(max_temp, daily_outcomes, len(interventions))
+
         return daily_outcomes
-    
-    def _map_interventions(self, interventions: List[InterventionScenario]) -> Dict[int, Dict]:
-        """Map interventions to affected residents."""
-        resident_interventions = {}
-        
-        for intervention in interventions:
-            # Simple distance-based mapping
-            if 'center_lat' in intervention.target_area:
-                center = (intervention.target_area['center_lat'], 
-                         intervention.target_area['center_lon'])
-                radius = intervention.target_area.get('radius_km', 1.0)
-                
-                # Find residents within radius
-                nearby_indices = self.spatial_index.query_ball_point(
-                    center, radius / 111  # Rough conversion km to degrees
-                )
-                
-                for idx in nearby_indices:
-                    if idx not in resident_interventions:
-                        resident_interventions[idx] = {}
-                    
-                    # Apply intervention effect
-                    if intervention.intervention_type == 'cooling_center':
-                        resident_interventions[idx]['cooling_center_nearby'] = True
-                    elif intervention.intervention_type == 'tree_canopy':
-                        resident_interventions[idx]['neighborhood_canopy_increase'] = True
-                    elif intervention.intervention_type == 'transit_cooling':
-                        resident_interventions[idx]['transit_cooling'] = True
-        
-        return resident_interventions
-    
-    def run_scenario(self, 
+
+    def _record_day(self, max_temp: float, outcomes: Dict[str, int],
+                    n_interventions: int):
+        """Write one day's results into the history arrays."""
+        self._ensure_history_capacity(1)
+        day = self.current_day
+        self.hist_temp[day] = max_temp
+        self.hist_heat_illness[day] = outcomes['heat_illness']
+        self.hist_severe[day] = outcomes['severe_heat_illness']
+        self.hist_deaths[day] = outcomes['deaths']
+        self.hist_er_visits[day] = outcomes['er_visits']
+        self.hist_active_interventions[day] = n_interventions
+        self.current_day += 1
+
+    def _map_interventions(
+        self, interventions: List[InterventionScenario]
+    ) -> InterventionState:
+        """Map interventions to per-resident boolean masks.
+
+        All intervention centers go into one batched query_ball_point
+        call (simple distance-based mapping): cKDTree amortizes the
+        tree descent across queries and, with workers=-1, fans them out
+        over cores since it releases the GIL.
+        """
+        n = self.store.n
+        cool_mask = np.zeros(n, dtype=np.bool_)
+        transit_mask = np.zeros(n, dtype=np.bool_)
+        canopy_mask = np.zeros(n, dtype=np.bool_)
+
+        located = [iv for iv in interventions if 'center_lat' in iv.target_area]
+        if not located:
+            return InterventionState(cool_mask, transit_mask, canopy_mask)
+
+        x, y = self.project(
+            np.array([iv.target_area['center_lat'] for iv in located]),
+            np.array([iv.target_area['center_lon'] for iv in located]),
+        )
+        centers = np.column_stack([x, y])
+        radii = np.array([
+            iv.target_area.get('radius_km', 1.0) * 1000.0  # true meters
+            for iv in located
+        ])
+        neighbor_lists = self.spatial_index.query_ball_point(
+            centers, radii, workers=-1
+        )
+
+        for intervention, nearby_indices in zip(located, neighbor_lists):
+            if intervention.intervention_type == 'cooling_center':
+                cool_mask[nearby_indices] = True
+            elif intervention.intervention_type == 'tree_canopy':
+                canopy_mask[nearby_indices] = True
+            elif intervention.intervention_type == 'transit_cooling':
+                transit_mask[nearby_indices] = True
+
+        return InterventionState(cool_mask, transit_mask, canopy_mask)
+
+    def reset_dynamic(self):
+        """Reset mutable per-day state without regenerating the population.
+
+        Ensemble and A/B runs only differ in interventions, so the
+        generated columns and the kd-tree stay valid between scenarios;
+        re-seeding and redrawing 100k samples per run would dominate a
+        sweep. Re-seeding the daily RNG also pairs the scenarios: both
+        runs consume identical uniform draws, so outcome differences
+        come from the interventions alone.
+        """
+        store = self.store
+        store.heat_exposure_today[:] = 0.0
+        store.hydration_level[:] = 1.0
+        store.health_status[:] = ResidentArray.HEALTHY
+        self.current_day = 0
+        self._any_affected = False
+        self._rng = np.random.default_rng(42)
+
+    def run_scenario(self,
                      days: int = 365,
                      temperature_profile: Optional[List[float]] = None,
                      interventions: List[InterventionScenario] = None) -> Dict:
         """
         Run a full simulation scenario.
-        
+
         Returns summary statistics and outcomes.
         """
         interventions = interventions or []
-        
-        # Generate temperature profile if not provided
+
+        # Generate temperature profile if not provided; coerce caller
+        # lists to one float32 array up front instead of boxing per day
         if temperature_profile is None:
             temperature_profile = self._generate_phoenix_temperatures(days)
-        
+        else:
+            temperature_profile = np.asarray(temperature_profile, dtype=np.float32)
+
         logger.info(f"Running {days}-day simulation with {len(interventions)} interventions...")
-        
+
+        # One up-front allocation for the whole scenario
+        self._ensure_history_capacity(len(temperature_profile))
+
+        # Interventions don't move during a scenario: resolve the
+        # spatial containment queries to boolean masks once, not per day
+        masks = self._map_interventions(interventions)
+
         for day, temp in enumerate(temperature_profile):
             if day % 30 == 0:
                 logger.info(f"Day {day}: {temp:.1f}°F")
-            
-            self.run_day(temp, interventions)
-        
-        # Compile results
+
+            self.run_day(temp, interventions, masks=masks)
+
+        # Compile results: single array sums over the recorded days
+        d = self.current_day
         total_outcomes = {
-            'heat_illness': sum(h['outcomes']['heat_illness'] for h in self.history),
-            'severe_heat_illness': sum(h['outcomes']['severe_heat_illness'] for h in self.history),
-            'deaths': sum(h['outcomes']['deaths'] for h in self.history),
-            'er_visits': sum(h['outcomes']['er_visits'] for h in self.history),
+            'heat_illness': int(self.hist_heat_illness[:d].sum()),
+            'severe_heat_illness': int(self.hist_severe[:d].sum()),
+            'deaths': int(self.hist_deaths[:d].sum()),
+            'er_visits': int(self.hist_er_visits[:d].sum()),
         }
-        
+
         logger.info("\n=== Simulation Complete ===")
         logger.info(f"Total deaths: {total_outcomes['deaths']}")
         logger.info(f"Total ER visits: {total_outcomes['er_visits']}")
         logger.info(f"Heat illness events: {total_outcomes['heat_illness']}")
-        
+
         return {
             'total_outcomes': total_outcomes,
-            'daily_history': self.history,
+            'daily_history': self._history_records(),
             'interventions': [i.name for i in interventions]
         }
-    
-    def _generate_phoenix_temperatures(self, days: int) -> List[float]:
-        """Generate realistic Phoenix temperature profile."""
-        temps = []
-        for day in range(days):
-            # Seasonal cycle
-            day_of_year = day % 365
-            base_temp = 70 + 35 * np.sin(2 * np.pi * day_of_year / 365 - np.pi/2)
-            
-            # Daily variation
-            noise = np.random.normal(0, 5)
-            temps.append(base_temp + noise)
-        
-        return temps
-    
+
+    def _generate_phoenix_temperatures(self, days: int,
+                                       seed: int = 42) -> np.ndarray:
+        """Generate realistic Phoenix temperature profile.
+
+        Delegates to the module-level cached builder so repeated
+        scenarios of the same length share one immutable array.
+        """
+        return _phoenix_temperature_profile(days, seed)
+
+    def get_vulnerable_arrays(self, threshold: float = 50.0) -> Dict[str, np.ndarray]:
+        """Residents above threshold as a dict of NumPy column slices.
+
+        Low-level sibling of get_vulnerable_populations for callers
+        that serialize with orjson (which encodes NumPy natively) —
+        no DataFrame materialization pass. Vulnerability is static
+        after generation, so the threshold cut is a binary search on
+        the cached sorted order (O(log n) plus the survivor slice)
+        rather than a full comparison scan. profile_code stays numeric;
+        decode with ResidentArray.PROFILE_LOOKUP if labels are needed.
+        """
+        store = self.store
+        if self._vuln_sorted is not None:
+            start = np.searchsorted(self._vuln_sorted, threshold, side='right')
+            # Re-sort the survivors so output order matches ids, as the
+            # mask formulation produced
+            idx = np.sort(self._vuln_order[start:])
+        else:
+            idx = np.flatnonzero(store.heat_vulnerability > threshold)
+
+        return {
+            'id': store.id[idx],
+            'lat': store.lat[idx],
+            'lon': store.lon[idx],
+            'vulnerability': store.heat_vulnerability[idx],
+            'age': store.age[idx],
+            'income': store.income[idx],
+            'has_ac': store.has_ac[idx],
+            'profile_code': store.profile_code[idx],
+        }
+
     def get_vulnerable_populations(self, threshold: float = 50.0) -> pd.DataFrame:
         """Get residents with vulnerability above threshold."""
-        vulnerable = [r for r in self.residents if r.heat_vulnerability > threshold]
-        
-        return pd.DataFrame([
-            {
-                'id': r.id,
-                'lat': r.lat,
-                'lon': r.lon,
-                'vulnerability': r.heat_vulnerability,
-                'age': r.age,
-                'income': r.income,
-                'has_ac': r.has_ac,
-                'profile': r.profile().value
-            }
-            for r in vulnerable
-        ])
+        columns = self.get_vulnerable_arrays(threshold)
+        columns['profile'] = pd.Categorical.from_codes(
+            columns.pop('profile_code'), ResidentArray.PROFILE_CATEGORIES
+        )
+        return pd.DataFrame(columns)
 
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
-    
+
     # Demo simulation
     sim = UrbanHeatSimulator(n_residents=10000)  # Small for demo
     sim.generate_synthetic_population()
-    
+
     # Baseline scenario (no interventions)
     print("\n--- Baseline (No Interventions) ---")
     baseline_results = sim.run_scenario(days=90)  # 3 months
-    
-    # Intervention scenario
+
+    # Intervention scenario: reuse the same population, only reset the
+    # per-day state
     print("\n--- With Interventions ---")
-    sim2 = UrbanHeatSimulator(n_residents=10000)
-    sim2.generate_synthetic_population()
-    
+    sim.reset_dynamic()
+
     interventions = [
         InterventionScenario(
             name="Downtown Cooling Centers",
@@ -436,14 +1152,14 @@ if __name__ == "__main__":
             timeline_months=12
         )
     ]
-    
-    intervention_results = sim2.run_scenario(days=90, interventions=interventions)
-    
+
+    intervention_results = sim.run_scenario(days=90, interventions=interventions)
+
     # Compare
     print("\n=== Impact Analysis ===")
     baseline_deaths = baseline_results['total_outcomes']['deaths']
     intervention_deaths = intervention_results['total_outcomes']['deaths']
     deaths_prevented = baseline_deaths - intervention_deaths
-    
+
     print(f"Deaths prevented: {deaths_prevented}")
-    print(f"Cost per death prevented: ${(2500000 / max(deaths_prevented, 1)):,.0f}")
\ No newline at end of file
+    print(f"Cost per death prevented: ${(2500000 / max(deaths_prevented, 1)):,.0f}")